@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
 from homeassistant.components.persistent_notification import async_create
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
@@ -17,6 +18,7 @@ from homeassistant.helpers import (
     area_registry as ar,
     config_validation as cv,
     device_registry as dr,
+    entity_registry as er,
 )
 from homeassistant.helpers.service import async_extract_config_entry_ids
 
@@ -51,6 +53,23 @@ SERVICE_FORCE_ARM_NIGHT = "force_arm_night"
 SERVICE_GET_RAW_DEVICES = "get_raw_devices"
 SERVICE_REFRESH_METADATA = "refresh_metadata"
 
+# Service fields
+ATTR_MODE = "mode"
+FORCE_ARM_MODE_AWAY = "away"
+FORCE_ARM_MODE_NIGHT = "night"
+
+# Service schemas, built once at import
+FORCE_ARM_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entity_id"): cv.entity_ids,
+        vol.Optional(ATTR_MODE, default=FORCE_ARM_MODE_AWAY): vol.In(
+            [FORCE_ARM_MODE_AWAY, FORCE_ARM_MODE_NIGHT]
+        ),
+    }
+)
+# Kept for existing automations, same as force_arm with mode: night
+FORCE_ARM_NIGHT_SCHEMA = vol.Schema({vol.Optional("entity_id"): cv.entity_ids})
+
 PLATFORMS: list[Platform] = [
     Platform.ALARM_CONTROL_PANEL,
     Platform.BINARY_SENSOR,
@@ -130,7 +149,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: AjaxConfigEntry) -> bool
     try:
         # Login to get temporary token (and API key + SSE URL if using proxy)
         await api.async_login()
-        _LOGGER.info("Successfully logged in to Ajax REST API")
+        _LOGGER.debug("Successfully logged in to Ajax REST API")
 
         # Get SSE URL if using proxy mode
         if auth_mode in (AUTH_MODE_PROXY_SECURE, AUTH_MODE_PROXY_HYBRID):
@@ -142,7 +161,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: AjaxConfigEntry) -> bool
 
         # Test API connection by getting hubs
         await api.async_get_hubs()
-        _LOGGER.info("Successfully connected to Ajax REST API")
+        _LOGGER.debug("Successfully connected to Ajax REST API")
 
     except AjaxRestAuthError as err:
         _LOGGER.error("Authentication failed: %s", err)
@@ -182,6 +201,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: AjaxConfigEntry) -> bool
     # Store coordinator
     entry.runtime_data = coordinator
 
+    # Shutdown coordinator (closes SQS/SSE managers, API connection and all tasks)
+    # through the entry's unload pipeline, also when setup fails past this point
+    entry.async_on_unload(coordinator.async_shutdown)
+
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
 
@@ -240,6 +263,34 @@ async def _async_update_options(hass: HomeAssistant, entry: AjaxConfigEntry) ->
                         break  # Only need one polling task
 
 
+def _resolve_alarm_target(
+    hass: HomeAssistant, entity_id: str
+) -> tuple[AjaxDataCoordinator, str] | None:
+    """Return the coordinator and space ID behind an Ajax space alarm panel."""
+    for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+        coordinator: AjaxDataCoordinator = entry.runtime_data
+        if (space_id := coordinator.alarm_entities.get(entity_id)) is not None:
+            return coordinator, space_id
+
+    # Entity not added to hass yet: the registry entry points at its config
+    # entry and its unique_id is formatted as "{entry_id}_alarm_{space_id}"
+    entity_entry = er.async_get(hass).async_get(entity_id)
+    if entity_entry is None or entity_entry.config_entry_id is None:
+        return None
+    entry = hass.config_entries.async_get_entry(entity_entry.config_entry_id)
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        return None
+    coordinator = entry.runtime_data
+    _, sep, space_id = entity_entry.unique_id.rpartition("_alarm_")
+    if not sep or not coordinator.account or space_id not in coordinator.account.spaces:
+        return None
+    return coordinator, space_id
+
+
 async def _async_setup_services(hass: HomeAssistant) -> None:
     """Set up Ajax services."""
 
@@ -260,42 +311,55 @@ async def _async_setup_services(hass: HomeAssistant) -> None:
             )
         return target_entries
 
-    async def handle_force_arm(call: ServiceCall) -> None:
-        """Handle force arm service call."""
-        entity_id = call.data.get("entity_id")
-        _LOGGER.info("Force arming via service call (entity: %s)", entity_id)
-
-        entries = await _extract_config_entry(call)
-        entry = entries[0]
-        coordinator = entry.runtime_data
-        # Get the first hub from coordinator
-        if coordinator.account and coordinator.account.spaces:
-            for hub_id in coordinator.account.spaces:
-                try:
-                    await coordinator.api.async_arm(hub_id, ignore_problems=True)
-                    await coordinator.async_request_refresh()
-                    _LOGGER.info("Force armed hub %s", hub_id)
-                except Exception as err:
-                    _LOGGER.error("Failed to force arm hub %s: %s", hub_id, err)
-
-    async def handle_force_arm_night(call: ServiceCall) -> None:
-        """Handle force arm night mode service call."""
-        entity_id = call.data.get("entity_id")
-        _LOGGER.info("Force arming night mode via service call (entity: %s)", entity_id)
-
-        entries = await _extract_config_entry(call)
-        entry = entries[0]
-        coordinator = entry.runtime_data
-        if coordinator.account and coordinator.account.spaces:
-            for hub_id in coordinator.account.spaces:
-                try:
-                    await coordinator.api.async_night_mode(hub_id, enabled=True)
-                    await coordinator.async_request_refresh()
-                    _LOGGER.info("Force armed night mode hub %s", hub_id)
-                except Exception as err:
+    async def handle_force_arm(call: ServiceCall, *, mode: str | None = None) -> None:
+        """Handle force arm service calls (away or night mode)."""
+        entity_ids = call.data.get("entity_id")
+        mode = mode or call.data[ATTR_MODE]
+        _LOGGER.info("Force arming %s via service call (entity: %s)", mode, entity_ids)
+
+        targets: list[tuple[AjaxDataCoordinator, str]] = []
+        if not entity_ids:
+            for entry in await _extract_config_entry(call):
+                coordinator = entry.runtime_data
+                if coordinator.account:
+                    targets.extend(
+                        (coordinator, hub_id) for hub_id in coordinator.account.spaces
+                    )
+        else:
+            # Only arm the spaces behind the targeted alarm panels, whichever
+            # entry they belong to
+            for entity_id in entity_ids:
+                if (target := _resolve_alarm_target(hass, entity_id)) is None:
                     _LOGGER.error(
-                        "Failed to force arm night mode hub %s: %s", hub_id, err
+                        "Entity %s is not an Ajax space alarm panel", entity_id
                     )
+                    continue
+                targets.append(target)
+            if not targets:
+                raise ServiceValidationError(
+                    translation_domain=DOMAIN,
+                    translation_key="invalid_target",
+                )
+
+        armed: set[AjaxDataCoordinator] = set()
+        for coordinator, hub_id in targets:
+            try:
+                # Coordinator methods tag the action so the real-time event
+                # is attributed to Home Assistant
+                if mode == FORCE_ARM_MODE_NIGHT:
+                    await coordinator.async_arm_night_mode(hub_id, force=True)
+                else:
+                    await coordinator.async_arm_space(hub_id, force=True)
+                armed.add(coordinator)
+                _LOGGER.info("Force armed %s hub %s", mode, hub_id)
+            except AjaxRestApiError as err:
+                # Already logged as an error by the coordinator
+                _LOGGER.debug("Failed to force arm %s hub %s: %s", mode, hub_id, err)
+
+        # One debounced refresh per coordinator, without holding up the service
+        # call (state normally arrives first through SSE/SQS)
+        for coordinator in armed:
+            hass.async_create_task(coordinator.async_request_refresh())
 
     async def handle_get_raw_devices(call: ServiceCall) -> None:
         """Handle get raw devices service call - get full raw API data for all devices."""
@@ -438,15 +502,15 @@ async def _async_setup_services(hass: HomeAssistant) -> None:
             DOMAIN,
             SERVICE_FORCE_ARM,
             handle_force_arm,
-            schema=vol.Schema({vol.Optional("entity_id"): cv.entity_ids}),
+            schema=FORCE_ARM_SCHEMA,
         )
 
     if not hass.services.has_service(DOMAIN, SERVICE_FORCE_ARM_NIGHT):
         hass.services.async_register(
             DOMAIN,
             SERVICE_FORCE_ARM_NIGHT,
-            handle_force_arm_night,
-            schema=vol.Schema({vol.Optional("entity_id"): cv.entity_ids}),
+            partial(handle_force_arm, mode=FORCE_ARM_MODE_NIGHT),
+            schema=FORCE_ARM_NIGHT_SCHEMA,
         )
 
     if not hass.services.has_service(DOMAIN, SERVICE_GET_RAW_DEVICES):
@@ -460,10 +524,8 @@ async def _async_setup_services(hass: HomeAssistant) -> None:
         """Handle refresh metadata service call - force full metadata refresh."""
         _LOGGER.info("Forcing full metadata refresh via service call")
 
-        entries = await _extract_config_entry(call)
-        entry = entries[0]
-        coordinator = entry.runtime_data
-        await coordinator.async_force_metadata_refresh()
+        for entry in await _extract_config_entry(call):
+            await entry.runtime_data.async_force_metadata_refresh()
 
         async_create(
             hass,
@@ -532,13 +594,8 @@ async def _async_setup_areas(
 
 async def async_unload_entry(hass: HomeAssistant, entry: AjaxConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        coordinator = entry.runtime_data
-
-        # Shutdown coordinator (closes SQS manager, API connection, and all tasks)
-        await coordinator.async_shutdown()
-
-    return unload_ok
+    # Coordinator shutdown is registered with entry.async_on_unload during setup
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
 async def async_migrate_entry(hass: HomeAssistant, entry: AjaxConfigEntry) -> bool:
@@ -219,6 +219,13 @@ class AjaxAlarmControlPanel(
         """When entity is added to hass, update device info in registry."""
         await super().async_added_to_hass()
 
+        # Let the force_arm services resolve this entity to its space directly
+        entity_id = self.entity_id
+        self.coordinator.alarm_entities[entity_id] = self._space_id
+        self.async_on_remove(
+            lambda: self.coordinator.alarm_entities.pop(entity_id, None)
+        )
+
         # Update hub device info in registry
         space = self.coordinator.get_space(self._space_id)
         if space and space.hub_details:
@@ -212,6 +212,11 @@ class AjaxBinarySensor(CoordinatorEntity[AjaxDataCoordinator], BinarySensorEntit
         if "name" in sensor_desc:
             self._attr_name = sensor_desc["name"]
 
+        # Resolve the value accessor once instead of on every state read
+        self._value_key = sensor_desc.get("value_key")
+        self._value_default = sensor_desc.get("default")
+        self._value_fn = sensor_desc.get("value_fn")
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
@@ -219,11 +224,13 @@ class AjaxBinarySensor(CoordinatorEntity[AjaxDataCoordinator], BinarySensorEntit
         if not device:
             return None
 
-        # Use value_fn from sensor description
-        value_fn = self._sensor_desc.get("value_fn")
-        if value_fn:
+        # Support both value_key (device attribute) and value_fn (function)
+        if self._value_key:
+            return device.attributes.get(self._value_key, self._value_default)
+
+        if self._value_fn:
             try:
-                return value_fn()
+                return self._value_fn()
             except Exception as err:
                 _LOGGER.error(
                     "Error getting value for sensor %s: %s",
@@ -21,6 +21,7 @@ import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from homeassistant.components.persistent_notification import async_create
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -38,10 +39,12 @@ from .const import (
     UPDATE_INTERVAL_ARMED,
     UPDATE_INTERVAL_DOOR_SENSORS,
 )
+from .event_codes import get_event_message
 from .models import (
     AjaxAccount,
     AjaxDevice,
     AjaxGroup,
+    AjaxNotification,
     AjaxRoom,
     AjaxSpace,
     AjaxVideoEdge,
@@ -134,6 +137,9 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxAccount]):
         self._pending_ha_actions: dict[
             str, float
         ] = {}  # hub_id -> timestamp of HA action
+        self.alarm_entities: dict[
+            str, str
+        ] = {}  # entity_id -> space_id (registered by alarm control panels)
 
         # SQS real-time events (optional, for direct mode)
         self.sqs_manager: SQSManager | None = None
@@ -437,12 +443,18 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxAccount]):
 
                 # Initialize real-time events in background
                 # Priority: SSE (proxy mode) > SQS (direct mode)
+                # Background tasks don't hold up HA startup and are cancelled
+                # with the config entry on unload
                 if not self._sse_initialized and self._sse_url:
                     # Proxy mode: use SSE for real-time events
-                    asyncio.create_task(self._async_init_sse())
+                    self.config_entry.async_create_background_task(
+                        self.hass, self._async_init_sse(), "ajax_sse_init"
+                    )
                 elif not self._sqs_initialized and self._aws_access_key_id:
                     # Direct mode: use SQS for real-time events
-                    asyncio.create_task(self._async_init_sqs())
+                    self.config_entry.async_create_background_task(
+                        self.hass, self._async_init_sqs(), "ajax_sqs_init"
+                    )
             else:
                 # Periodic update - optimized polling
                 # Check if we need full metadata refresh (hourly or forced)
@@ -1073,7 +1085,7 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxAccount]):
                     room_name=room_name,
                     group_id=device_data.get("groupId", device_data.get("group_id")),
                 )
-                space.devices[device_id] = device
+                space.add_device(device)
                 new_devices_count += 1
 
                 # Log new device with details for debugging
@@ -1579,8 +1591,6 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxAccount]):
 
             for notif_data in notifications_data:
                 # Parse notification data
-                from .models import AjaxNotification
-
                 # Determine notification type based on event_type
                 event_type = notif_data.get("event_type", "")
                 notif_type = self._parse_notification_type(event_type)
@@ -1744,8 +1754,6 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxAccount]):
 
     def _parse_notification_type(self, event_type: str | None) -> NotificationType:
         """Parse notification type from event type string."""
-        from .models import NotificationType
-
         if not event_type:
             return NotificationType.INFO
 
@@ -1862,8 +1870,6 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxAccount]):
         action = action_map.get(new_state, new_state.value.lower())
 
         # Get translated message
-        from .event_codes import get_event_message
-
         ha_language = self.hass.config.language or "en"
         lang_map = {"fr": "fr", "es": "es", "en": "en"}
         language = lang_map.get(ha_language[:2], "en")
@@ -1894,8 +1900,6 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxAccount]):
         self, action: str, source_name: str, space_name: str
     ) -> None:
         """Create a persistent notification in HA for SQS events."""
-        from homeassistant.components.persistent_notification import async_create
-
         # Check notification filter settings
         options = self.config_entry.options if self.config_entry else {}
 
@@ -1928,9 +1932,6 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxAccount]):
 
         # NOTIFICATION_FILTER_SECURITY_EVENTS and NOTIFICATION_FILTER_ALL show everything
 
-        # Map action to translated message using event_codes
-        from .event_codes import get_event_message
-
         # Get language from Home Assistant
         ha_language = self.hass.config.language or "en"
         lang_map = {"fr": "fr", "es": "es", "en": "en"}
@@ -2190,8 +2191,6 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxAccount]):
 
     def _register_ha_action(self, hub_id: str) -> None:
         """Register that Home Assistant triggered an action on this hub."""
-        import time
-
         self._pending_ha_actions[hub_id] = time.time()
 
     def has_pending_ha_action(self, hub_id: str) -> bool:
@@ -2200,8 +2199,6 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxAccount]):
         Returns True if HA action was within the last 10 seconds.
         Does NOT consume the pending action (can be called multiple times).
         """
-        import time
-
         timestamp = self._pending_ha_actions.get(hub_id, 0)
         return time.time() - timestamp < 10
 
@@ -2209,16 +2206,14 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxAccount]):
         """Check and consume pending HA action.
 
         Returns True if HA action was within the last 10 seconds.
-        Clears the pending action after returning True.
+        Clears the pending action, expired or not, so the map stays empty
+        between HA actions.
         """
-        import time
-
-        timestamp = self._pending_ha_actions.get(hub_id, 0)
-        if time.time() - timestamp < 10:
-            # Clear the pending action
-            del self._pending_ha_actions[hub_id]
-            return True
-        return False
+        # Fast path: most real-time events are not triggered by HA
+        if not self._pending_ha_actions:
+            return False
+        timestamp = self._pending_ha_actions.pop(hub_id, None)
+        return timestamp is not None and time.time() - timestamp < 10
 
     async def async_arm_space(self, space_id: str, force: bool = True) -> None:
         """Arm a space.
@@ -58,8 +58,10 @@ class AjaxDeviceHandler(ABC):
                 - key: Unique key for the sensor
                 - name: Display name
                 - device_class: BinarySensorDeviceClass
-                - value_fn: Function to get the value from device
-                - enabled_by_default: Whether enabled by default
+                - value_key: Device attribute holding the value (read directly)
+                - default: Value used while value_key is missing
+                - value_fn: Function to get the value from device (if no value_key)
+                - enabled_by_default: Whether enabled by default (optional, defaults to True)
         """
         return []
 
@@ -74,8 +76,10 @@ class AjaxDeviceHandler(ABC):
                 - device_class: SensorDeviceClass
                 - native_unit_of_measurement: Optional unit
                 - state_class: Optional SensorStateClass
-                - value_fn: Function to get the value from device
-                - enabled_by_default: Whether enabled by default
+                - value_key: Device attribute holding the value (read directly)
+                - default: Value used while value_key is missing
+                - value_fn: Function to get the value from device (if no value_key)
+                - enabled_by_default: Whether enabled by default (optional, defaults to True)
         """
         return []
 
@@ -8,6 +8,8 @@ Handles:
 
 from __future__ import annotations
 
+from functools import cache
+
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -20,58 +22,116 @@ from homeassistant.const import (
 
 from .base import AjaxDeviceHandler
 
+# Descriptors that only read device attributes carry no per-device state,
+# so they are built once here and shared by every handler instance.
+
+# Main opening sensor - always create it even if attribute doesn't exist yet
+# The attribute will be populated by SQS notifications
+# Note: No translation_key needed - HA provides automatic translation for OPENING device_class
+_DOOR_BINARY_SENSOR = {
+    "key": "door",
+    "device_class": BinarySensorDeviceClass.OPENING,
+    "value_key": "door_opened",
+    "default": False,
+    "name": None,
+}
+
+# External contact (for connecting wired sensors)
+_EXTERNAL_CONTACT_BINARY_SENSOR = {
+    "key": "external_contact",
+    "translation_key": "external_contact",
+    "device_class": BinarySensorDeviceClass.OPENING,
+    "value_key": "external_contact_opened",
+    "default": False,
+}
+
+# Tamper / Couvercle - inverted: False = closed (OK), True = open (problem)
+# Note: No translation_key needed - HA provides automatic translation for TAMPER device_class
+_TAMPER_BINARY_SENSOR = {
+    "key": "tamper",
+    "device_class": BinarySensorDeviceClass.TAMPER,
+    "value_key": "tampered",
+    "default": False,
+}
+
+# Temperature (DoorProtect Plus)
+# Note: No translation_key needed - HA provides automatic translation for TEMPERATURE device_class
+_TEMPERATURE_SENSOR = {
+    "key": "temperature",
+    "device_class": SensorDeviceClass.TEMPERATURE,
+    "native_unit_of_measurement": UnitOfTemperature.CELSIUS,
+    "state_class": SensorStateClass.MEASUREMENT,
+    "value_key": "temperature",
+}
+
+# Connection type / Connexion via Jeweller
+_CONNECTION_TYPE_SENSOR = {
+    "key": "connection_type",
+    "translation_key": "connection_type",
+    "value_key": "connection_type",
+}
+
+# Operating mode / Mode de fonctionnement
+_OPERATING_MODE_SENSOR = {
+    "key": "operating_mode",
+    "translation_key": "operating_mode",
+    "value_key": "operating_mode",
+}
+
+# Device attributes that decide which shared descriptors a device gets
+_BINARY_SENSOR_CAPABILITIES = ("extra_contact_aware",)
+_SENSOR_CAPABILITIES = frozenset({"temperature", "connection_type", "operating_mode"})
+
+
+@cache
+def _shared_binary_sensors(capabilities: frozenset[str]) -> tuple[dict, ...]:
+    """Return the shared binary sensor descriptors for a capability set."""
+    sensors = [_DOOR_BINARY_SENSOR]
+
+    # Only create if extraContactAware is True (feature enabled on device)
+    if "extra_contact_aware" in capabilities:
+        sensors.append(_EXTERNAL_CONTACT_BINARY_SENSOR)
+
+    # Note: "armed_in_night_mode" is now a switch, not a binary sensor
+
+    sensors.append(_TAMPER_BINARY_SENSOR)
+    return tuple(sensors)
+
+
+@cache
+def _shared_sensors(capabilities: frozenset[str]) -> tuple[dict, ...]:
+    """Return the shared sensor descriptors for a capability set."""
+    sensors = []
+
+    if "temperature" in capabilities:
+        sensors.append(_TEMPERATURE_SENSOR)
+
+    # Note: firmware_version and hardware_version are available on device_info
+    # so we don't need separate sensors for them
+
+    if "connection_type" in capabilities:
+        sensors.append(_CONNECTION_TYPE_SENSOR)
+
+    if "operating_mode" in capabilities:
+        sensors.append(_OPERATING_MODE_SENSOR)
+
+    return tuple(sensors)
+
 
 class DoorContactHandler(AjaxDeviceHandler):
     """Handler for Ajax DoorProtect door/window contact sensors."""
 
     def get_binary_sensors(self) -> list[dict]:
         """Return binary sensor entities for door contacts."""
-        sensors = []
-
-        # Main opening sensor - always create it even if attribute doesn't exist yet
-        # The attribute will be populated by SQS notifications
-        # Note: No translation_key needed - HA provides automatic translation for OPENING device_class
-        sensors.append(
-            {
-                "key": "door",
-                "device_class": BinarySensorDeviceClass.OPENING,
-                "value_fn": lambda: self.device.attributes.get("door_opened", False),
-                "enabled_by_default": True,
-                "name": None,
-            }
-        )
-
-        # External contact (for connecting wired sensors)
-        # Only create if extraContactAware is True (feature enabled on device)
-        if self.device.attributes.get("extra_contact_aware", False):
-            sensors.append(
-                {
-                    "key": "external_contact",
-                    "translation_key": "external_contact",
-                    "device_class": BinarySensorDeviceClass.OPENING,
-                    "value_fn": lambda: self.device.attributes.get(
-                        "external_contact_opened", False
-                    ),
-                    "enabled_by_default": True,
-                }
-            )
-
-        # Note: "armed_in_night_mode" is now a switch, not a binary sensor
-
-        # Tamper / Couvercle - inverted: False = closed (OK), True = open (problem)
-        # Note: No translation_key needed - HA provides automatic translation for TAMPER device_class
-        sensors.append(
-            {
-                "key": "tamper",
-                "device_class": BinarySensorDeviceClass.TAMPER,
-                "value_fn": lambda: self.device.attributes.get("tampered", False),
-                "enabled_by_default": True,
-            }
+        attrs = self.device.attributes
+        capabilities = frozenset(
+            key for key in _BINARY_SENSOR_CAPABILITIES if attrs.get(key, False)
         )
+        sensors = list(_shared_binary_sensors(capabilities))
 
         # Tilt sensor / Capteur d'inclinaison (DoorProtect Plus)
         # Only create if accelerometerAware is True (feature enabled on device)
-        if self.device.attributes.get("accelerometer_aware", False):
+        if attrs.get("accelerometer_aware", False):
             sensors.append(
                 {
                     "key": "tilt",
@@ -80,13 +140,12 @@ class DoorContactHandler(AjaxDeviceHandler):
                     "value_fn": lambda: self.device.attributes.get(
                         "tilt_detected", self.device.attributes.get("tilt", False)
                     ),
-                    "enabled_by_default": True,
                 }
             )
 
         # Shock sensor / Capteur de choc (DoorProtect Plus)
         # Only create if shockSensorAware is True (feature enabled on device)
-        if self.device.attributes.get("shock_sensor_aware", False):
+        if attrs.get("shock_sensor_aware", False):
             sensors.append(
                 {
                     "key": "shock",
@@ -95,7 +154,6 @@ class DoorContactHandler(AjaxDeviceHandler):
                     "value_fn": lambda: self.device.attributes.get(
                         "shock_detected", self.device.attributes.get("shock", False)
                     ),
-                    "enabled_by_default": True,
                 }
             )
 
@@ -103,6 +161,7 @@ class DoorContactHandler(AjaxDeviceHandler):
 
     def get_sensors(self) -> list[dict]:
         """Return sensor entities for door contacts."""
+        attrs = self.device.attributes
         sensors = []
 
         # Battery level - always create even if None, will be updated by notifications
@@ -116,7 +175,6 @@ class DoorContactHandler(AjaxDeviceHandler):
                 "value_fn": lambda: self.device.battery_level
                 if self.device.battery_level is not None
                 else None,
-                "enabled_by_default": True,
             }
         )
 
@@ -130,48 +188,10 @@ class DoorContactHandler(AjaxDeviceHandler):
                 "value_fn": lambda: self.device.signal_strength
                 if self.device.signal_strength is not None
                 else None,
-                "enabled_by_default": True,
             }
         )
 
-        # Temperature (DoorProtect Plus)
-        # Note: No translation_key needed - HA provides automatic translation for TEMPERATURE device_class
-        if "temperature" in self.device.attributes:
-            sensors.append(
-                {
-                    "key": "temperature",
-                    "device_class": SensorDeviceClass.TEMPERATURE,
-                    "native_unit_of_measurement": UnitOfTemperature.CELSIUS,
-                    "state_class": SensorStateClass.MEASUREMENT,
-                    "value_fn": lambda: self.device.attributes.get("temperature"),
-                    "enabled_by_default": True,
-                }
-            )
-
-        # Note: firmware_version and hardware_version are available on device_info
-        # so we don't need separate sensors for them
-
-        # Connection type / Connexion via Jeweller
-        if "connection_type" in self.device.attributes:
-            sensors.append(
-                {
-                    "key": "connection_type",
-                    "translation_key": "connection_type",
-                    "value_fn": lambda: self.device.attributes.get("connection_type"),
-                    "enabled_by_default": True,
-                }
-            )
-
-        # Operating mode / Mode de fonctionnement
-        if "operating_mode" in self.device.attributes:
-            sensors.append(
-                {
-                    "key": "operating_mode",
-                    "translation_key": "operating_mode",
-                    "value_fn": lambda: self.device.attributes.get("operating_mode"),
-                    "enabled_by_default": True,
-                }
-            )
+        sensors.extend(_shared_sensors(frozenset(attrs.keys() & _SENSOR_CAPABILITIES)))
 
         # Battery state / État de la batterie (normal/faible/critique)
         if self.device.battery_state is not None:
@@ -180,7 +200,6 @@ class DoorContactHandler(AjaxDeviceHandler):
                     "key": "battery_state",
                     "translation_key": "battery_state",
                     "value_fn": lambda: self.device.battery_state,
-                    "enabled_by_default": True,
                 }
             )
 
@@ -342,21 +361,14 @@ class WireInputHandler(DoorContactHandler):
             {
                 "key": "door",
                 "device_class": BinarySensorDeviceClass.OPENING,
-                "value_fn": lambda: self.device.attributes.get("door_opened", False),
-                "enabled_by_default": True,
+                "value_key": "door_opened",
+                "default": False,
             }
         ]
 
         # TWO_EOL wiring scheme has tamper detection (contactOneDetails)
         if self.device.attributes.get("wiring_type") == "TWO_EOL":
-            sensors.append(
-                {
-                    "key": "tamper",
-                    "device_class": BinarySensorDeviceClass.TAMPER,
-                    "value_fn": lambda: self.device.attributes.get("tampered", False),
-                    "enabled_by_default": True,
-                }
-            )
+            sensors.append(_TAMPER_BINARY_SENSOR)
 
         return sensors
 
@@ -366,24 +378,8 @@ class WireInputHandler(DoorContactHandler):
         # Only return temperature if available
         sensors = []
 
-        # Note: No translation_key needed - HA provides automatic translation for TEMPERATURE device_class
         if "temperature" in self.device.attributes:
-            from homeassistant.components.sensor import (
-                SensorDeviceClass,
-                SensorStateClass,
-            )
-            from homeassistant.const import UnitOfTemperature
-
-            sensors.append(
-                {
-                    "key": "temperature",
-                    "device_class": SensorDeviceClass.TEMPERATURE,
-                    "native_unit_of_measurement": UnitOfTemperature.CELSIUS,
-                    "state_class": SensorStateClass.MEASUREMENT,
-                    "value_fn": lambda: self.device.attributes.get("temperature"),
-                    "enabled_by_default": True,
-                }
-            )
+            sensors.append(_TEMPERATURE_SENSOR)
 
         return sensors
 
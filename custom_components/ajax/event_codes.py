@@ -15,6 +15,9 @@ Supported languages: fr, en, es
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 # Event types (eventTypeV2 field in SQS events)
@@ -1082,9 +1085,10 @@ def get_event_type_description(
     return next(iter(descriptions.values()), event_type)
 
 
+@lru_cache(maxsize=1024)
 def parse_event_code(
     event_code: str, language: str = DEFAULT_LANGUAGE
-) -> dict[str, Any] | None:
+) -> Mapping[str, Any] | None:
     """Parse an event code and return event details.
 
     Args:
@@ -1092,7 +1096,8 @@ def parse_event_code(
         language: Language code for message translation (fr, en, es)
 
     Returns:
-        Dict with action, message, category, is_alarm, device_type, transition or None if not found
+        Cached read-only mapping with action, message, category, is_alarm,
+        device_type, transition or None if not found
 
     Event code format: M_XX_YY
     - M = signal type (fixed)
@@ -1126,30 +1131,34 @@ def parse_event_code(
     # Look up in our mapping
     if code not in EVENT_CODES:
         # Return basic info even if not in mapping
-        return {
-            "action": "unknown",
-            "message": event_code,
-            "category": "unknown",
-            "is_alarm": False,
-            "device_type": None,
-            "event_code": code,
-            "transition": transition,
-        }
+        return MappingProxyType(
+            {
+                "action": "unknown",
+                "message": event_code,
+                "category": "unknown",
+                "is_alarm": False,
+                "device_type": None,
+                "event_code": code,
+                "transition": transition,
+            }
+        )
 
     action_key, is_alarm = EVENT_CODES[code]
     category = ACTION_CATEGORIES.get(action_key, "unknown")
     message = get_event_message(action_key, language)
     device_type = get_device_type_name(code)
 
-    return {
-        "action": action_key,
-        "message": message,
-        "category": category,
-        "is_alarm": is_alarm,
-        "device_type": device_type,
-        "event_code": code,
-        "transition": transition,
-    }
+    return MappingProxyType(
+        {
+            "action": action_key,
+            "message": message,
+            "category": category,
+            "is_alarm": is_alarm,
+            "device_type": device_type,
+            "event_code": code,
+            "transition": transition,
+        }
+    )
 
 
 def get_device_type_name(event_code: str) -> str | None:
@@ -351,9 +351,24 @@ class AjaxSpace:
     # Recent events from SQS (last 5 events)
     recent_events: list[dict[str, Any]] = field(default_factory=list)
 
+    # Device lookup indexes for real-time events (kept in sync by add_device)
+    devices_by_name: dict[str, AjaxDevice] = field(default_factory=dict, repr=False)
+    devices_by_id_suffix: dict[str, AjaxDevice] = field(
+        default_factory=dict, repr=False
+    )
+
     def __str__(self) -> str:
         return f"Space({self.name}, state={self.security_state.value}, devices={len(self.devices)})"
 
+    def add_device(self, device: AjaxDevice) -> None:
+        """Add a device and index it by name and wire input suffix."""
+        self.devices[device.id] = device
+        # Keep the first device on duplicate names
+        self.devices_by_name.setdefault(device.name, device)
+        # WireInput devices (16-char ID) are reported by their 8-char suffix
+        if len(device.id) == 16:
+            self.devices_by_id_suffix.setdefault(device.id[-8:], device)
+
     def get_devices_in_room(self, room_id: str) -> list[AjaxDevice]:
         """Get all devices in a specific room."""
         return [d for d in self.devices.values() if d.room_id == room_id]
@@ -726,6 +726,11 @@ class AjaxDeviceSensor(CoordinatorEntity[AjaxDataCoordinator], SensorEntity):
                 "enabled_by_default"
             ]
 
+        # Resolve the value accessor once instead of on every state read
+        self._value_key = sensor_desc.get("value_key")
+        self._value_default = sensor_desc.get("default")
+        self._value_fn = sensor_desc.get("value_fn")
+
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
@@ -733,10 +738,13 @@ class AjaxDeviceSensor(CoordinatorEntity[AjaxDataCoordinator], SensorEntity):
         if not device:
             return None
 
-        value_fn = self._sensor_desc.get("value_fn")
-        if value_fn:
+        # Support both value_key (device attribute) and value_fn (function)
+        if self._value_key:
+            return device.attributes.get(self._value_key, self._value_default)
+
+        if self._value_fn:
             try:
-                return value_fn()
+                return self._value_fn()
             except Exception as err:
                 _LOGGER.error(
                     "Error getting value for sensor %s: %s",
@@ -53,6 +53,7 @@ class AjaxSSEClient:
         self._hass_loop = hass_loop
         self._running = False
         self._task: asyncio.Task | None = None
+        self._callback_tasks: set[asyncio.Task] = set()  # keep strong references
         self._session: aiohttp.ClientSession | None = None
         self._reconnect_delay = self.RECONNECT_DELAY
 
@@ -180,7 +181,7 @@ class AjaxSSEClient:
             if self._hass_loop:
                 # Thread-safe callback to HA event loop
                 self._hass_loop.call_soon_threadsafe(
-                    lambda: asyncio.create_task(self._async_callback(event_data))
+                    self._schedule_callback, event_data
                 )
             else:
                 self._callback(event_data)
@@ -190,6 +191,12 @@ class AjaxSSEClient:
         except Exception as err:
             _LOGGER.error("Error processing SSE event: %s", err)
 
+    def _schedule_callback(self, event_data: dict[str, Any]) -> None:
+        """Run the callback in a task that is kept referenced until done."""
+        task = asyncio.create_task(self._async_callback(event_data))
+        self._callback_tasks.add(task)
+        task.add_done_callback(self._callback_tasks.discard)
+
     async def _async_callback(self, event_data: dict[str, Any]) -> None:
         """Async wrapper for callback."""
         try:
@@ -200,6 +207,14 @@ class AjaxSSEClient:
         except Exception as err:
             _LOGGER.error("SSE callback error: %s", err)
 
+    def set_callback(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        """Set the function called for each received event.
+
+        Args:
+            callback: Function (or coroutine function) to call with event data
+        """
+        self._callback = callback
+
     def update_session_token(self, new_token: str) -> None:
         """Update session token (e.g., after token refresh).
 
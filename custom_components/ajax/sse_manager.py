@@ -15,10 +15,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 from .event_codes import DEFAULT_LANGUAGE, parse_event_code
+from .models import AjaxSpace, SecurityState
 from .sqs_manager import (  # Import event mappings from SQS manager to avoid duplication
     DEVICE_STATUS_EVENTS,
     DOOR_EVENTS,
@@ -41,10 +44,80 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Dedup cache limits
+_DEDUP_MAX_AGE = 60  # seconds
+_DEDUP_MAX_EVENTS = 4096
+_DEDUP_SWEEP_INTERVAL = 30  # seconds
+
+# SSE state protection against REST overwrites, in 0.1 s monotonic buckets
+_BUCKETS_PER_SECOND = 10
+_STATE_PROTECTION_BUCKETS = 5 * _BUCKETS_PER_SECOND
+
+# Event tag sets for membership tests, frozen once at import
+_SECURITY_TAGS = frozenset(EVENT_TAG_TO_STATE)
+_GROUP_SECURITY_TAGS = frozenset({"grouparm", "groupdisarm"})
+_VIDEO_TYPES_V2 = frozenset(VIDEO_EVENT_TYPES)
+
+# Device event handler: (space, event, event_tag, source_name, source_id, transition)
+type _EventHandler = Callable[[AjaxSpace, dict[str, Any], str, str, str, str], None]
+
+
+def _time_bucket() -> int:
+    """Return the current monotonic time as a 0.1 s bucket number."""
+    return int(time.monotonic() * _BUCKETS_PER_SECOND)
+
+
+def _extract_source(event: dict[str, Any]) -> tuple[str, str, str]:
+    """Return (name, id, type) of the event source.
+
+    Different proxy formats put it in device, source or flat sourceObject* keys.
+    """
+    # Normalize once so the lookups below need no type guards
+    source = event.get("source")
+    if not isinstance(source, dict):
+        source = {}
+    device = event.get("device")
+    if not isinstance(device, dict):
+        device = {}
+
+    # Name: try device.name, source.name, sourceObjectName, sourceName
+    source_name = (
+        device.get("name")
+        or source.get("name")
+        or event.get("sourceObjectName")
+        or event.get("sourceName", "")
+    )
+    # ID: try device.id, sourceObjectId, deviceId
+    source_id = (
+        device.get("id") or event.get("sourceObjectId") or event.get("deviceId", "")
+    )
+    # Type: try device.type, source.type, sourceObjectType, sourceType
+    source_type = (
+        device.get("type")
+        or source.get("type")
+        or event.get("sourceObjectType")
+        or event.get("sourceType", "")
+    )
+    return source_name, source_id, source_type
+
 
 class SSEManager:
     """Manages SSE events from Ajax proxy."""
 
+    __slots__ = (
+        "_dedup_window",
+        "_dispatch",
+        "_event_time",
+        "_hub_index",
+        "_known_tags",
+        "_language",
+        "_last_state_update",
+        "_recent_events",
+        "_sweep_handle",
+        "coordinator",
+        "sse_client",
+    )
+
     def __init__(
         self,
         coordinator: AjaxDataCoordinator,
@@ -59,9 +132,40 @@ class SSEManager:
         self.coordinator = coordinator
         self.sse_client = sse_client
         self._language = DEFAULT_LANGUAGE
-        self._last_state_update: dict[str, float] = {}  # hub_id -> timestamp
-        self._recent_events: dict[str, float] = {}  # event_key -> timestamp
+        self._last_state_update: dict[str, int] = {}  # hub_id -> time bucket
+        # (source_id, event_tag, transition) -> monotonic time, oldest first
+        self._recent_events: OrderedDict[tuple[str, str, str], float] = OrderedDict()
         self._dedup_window = 5  # seconds to ignore duplicate events
+        self._hub_index: dict[str, AjaxSpace] = {}  # hub_id -> space
+        self._dispatch = self._build_dispatch()  # event_tag -> handler
+        self._known_tags = _SECURITY_TAGS.union(self._dispatch, DOORBELL_EVENTS)
+        self._event_time = datetime.now(timezone.utc)  # event being handled
+        self._sweep_handle: asyncio.TimerHandle | None = None
+
+    def _build_dispatch(self) -> dict[str, _EventHandler]:
+        """Map every device event tag to its handler.
+
+        Security events are awaited separately, and doorbell events are handled
+        after the eventTypeV2 video check. Categories listed first win when a
+        tag appears in several mappings, matching the previous if/elif order.
+        """
+        categories: tuple[tuple[dict[str, Any], _EventHandler], ...] = (
+            (DOOR_EVENTS, self._handle_door_event),
+            (MOTION_EVENTS, self._handle_motion_event),
+            (SMOKE_EVENTS, self._handle_smoke_event),
+            (FLOOD_EVENTS, self._handle_flood_event),
+            (GLASS_EVENTS, self._handle_glass_event),
+            (TAMPER_EVENTS, self._handle_tamper_event),
+            (DEVICE_STATUS_EVENTS, self._handle_device_status_event),
+            (RELAY_EVENTS, self._handle_relay_event),
+            (SCENARIO_EVENTS, self._handle_scenario_event),
+            (VIDEO_EVENTS, self._handle_video_event),
+        )
+        dispatch: dict[str, _EventHandler] = {}
+        for tags, handler in categories:
+            for tag in tags:
+                dispatch.setdefault(tag, handler)
+        return dispatch
 
     def set_language(self, language: str) -> None:
         """Set language for event messages."""
@@ -76,12 +180,17 @@ class SSEManager:
         _LOGGER.info("Starting SSE Manager...")
 
         # Set up callback for received events
-        self.sse_client._callback = self._handle_event
+        self.sse_client.set_callback(self._handle_event)
 
         # Start SSE client
         success = await self.sse_client.start()
 
         if success:
+            # Expire dedup entries in the background, off the event path
+            if self._sweep_handle is None:
+                self._sweep_handle = self.coordinator.hass.loop.call_later(
+                    _DEDUP_SWEEP_INTERVAL, self._sweep_dedup
+                )
             _LOGGER.info("SSE Manager started successfully")
         else:
             _LOGGER.error("Failed to start SSE Manager")
@@ -92,8 +201,25 @@ class SSEManager:
         """Stop receiving SSE events."""
         _LOGGER.info("Stopping SSE Manager...")
         await self.sse_client.stop()
+        if self._sweep_handle is not None:
+            self._sweep_handle.cancel()
+            self._sweep_handle = None
         _LOGGER.info("SSE Manager stopped")
 
+    def _sweep_dedup(self) -> None:
+        """Drop expired dedup entries and schedule the next sweep."""
+        recent_events = self._recent_events
+        now = time.monotonic()
+        # Entries are kept oldest first, so stop at the first fresh one
+        while recent_events and (
+            len(recent_events) > _DEDUP_MAX_EVENTS
+            or now - next(iter(recent_events.values())) >= _DEDUP_MAX_AGE
+        ):
+            recent_events.popitem(last=False)
+        self._sweep_handle = self.coordinator.hass.loop.call_later(
+            _DEDUP_SWEEP_INTERVAL, self._sweep_dedup
+        )
+
     def is_state_protected(self, hub_id: str) -> bool:
         """Check if a hub's state was recently updated via SSE.
 
@@ -105,8 +231,11 @@ class SSEManager:
         Returns:
             True if state was updated via SSE in the last 5 seconds
         """
-        last_update = self._last_state_update.get(hub_id, 0)
-        return (time.time() - last_update) < 5
+        last_update = self._last_state_update.get(hub_id)
+        return (
+            last_update is not None
+            and _time_bucket() - last_update < _STATE_PROTECTION_BUCKETS
+        )
 
     async def _handle_event(self, event_data: dict[str, Any]) -> None:
         """Handle an SSE event.
@@ -132,8 +261,9 @@ class SSEManager:
         }
         """
         try:
-            # Handle both nested and flat event formats
-            event = event_data.get("event", event_data)
+            # Handle both nested and flat event formats, decided by one lookup
+            nested = event_data.get("event")
+            event = nested if isinstance(nested, dict) else event_data
 
             event_tag = event.get("eventTag", "").lower()
             hub_id = event.get("hubId")
@@ -142,41 +272,26 @@ class SSEManager:
                 _LOGGER.debug("SSE event missing eventTag or hubId: %s", event_data)
                 return
 
-            # Extract event details
-            event_code = event.get("eventCode", "")
-
-            # Try multiple ways to get source info (different proxy formats)
-            source = event.get("source", {})
-            device = event.get("device", {})
+            # Also check eventTypeV2 for video AI events
+            event_type_v2 = event.get("eventTypeV2", "")
 
-            # Source name: try device.name, source.name, sourceObjectName, sourceName
-            source_name = (
-                device.get("name")
-                if isinstance(device, dict) and device.get("name")
-                else (source.get("name") if isinstance(source, dict) else None)
-            )
-            if not source_name:
-                source_name = event.get("sourceObjectName") or event.get(
-                    "sourceName", ""
+            # Skip unsupported events before parsing source and event code
+            if (
+                event_tag not in self._known_tags
+                and event_type_v2 not in _VIDEO_TYPES_V2
+            ):
+                _LOGGER.warning(
+                    "SSE event not handled: tag=%s, typeV2=%s. Raw: %s",
+                    event_tag,
+                    event_type_v2 or "none",
+                    event,
                 )
+                return
 
-            # Source ID: try device.id, sourceObjectId, deviceId
-            source_id = (
-                device.get("id")
-                if isinstance(device, dict) and device.get("id")
-                else event.get("sourceObjectId") or event.get("deviceId", "")
-            )
+            # Extract event details
+            event_code = event.get("eventCode", "")
 
-            # Source type: try device.type, source.type, sourceObjectType, sourceType
-            source_type = (
-                device.get("type")
-                if isinstance(device, dict) and device.get("type")
-                else (source.get("type") if isinstance(source, dict) else None)
-            )
-            if not source_type:
-                source_type = event.get("sourceObjectType") or event.get(
-                    "sourceType", ""
-                )
+            source_name, source_id, source_type = _extract_source(event)
 
             # Parse event code for type info
             code_info = parse_event_code(event_code)
@@ -185,10 +300,7 @@ class SSEManager:
                 code_info.get("transition", "TRIGGERED") if code_info else "TRIGGERED"
             )
 
-            # Also check eventTypeV2 for video AI events
-            event_type_v2 = event.get("eventTypeV2", "")
-
-            _LOGGER.info(
+            _LOGGER.debug(
                 "SSE event: type=%s, tag=%s, code=%s, source=%s (%s), id=%s, transition=%s, typeV2=%s",
                 event_type,
                 event_tag,
@@ -204,79 +316,45 @@ class SSEManager:
             _LOGGER.debug("SSE raw event data: %s", event)
 
             # Deduplication: ignore duplicate events within window
-            event_key = f"{source_id}:{event_tag}:{transition}"
-            now = time.time()
-            last_time = self._recent_events.get(event_key, 0)
-            if now - last_time < self._dedup_window:
+            recent_events = self._recent_events
+            event_key = (source_id, event_tag, transition)
+            now = time.monotonic()
+            last_time = recent_events.get(event_key)
+            if last_time is not None and now - last_time < self._dedup_window:
                 _LOGGER.debug(
                     "SSE event ignored (duplicate): %s, last seen %.1fs ago",
                     event_key,
                     now - last_time,
                 )
                 return
-            self._recent_events[event_key] = now
-
-            # Cleanup old entries (keep dict from growing indefinitely)
-            self._recent_events = {
-                k: v for k, v in self._recent_events.items() if now - v < 60
-            }
+            recent_events[event_key] = now
+            recent_events.move_to_end(event_key)
 
             # Get space by hub_id
-            space = None
-            for s in self.coordinator.account.spaces.values():
-                if s.hub_id == hub_id:
-                    space = s
-                    break
-
+            space = self._find_space(hub_id)
             if not space:
                 _LOGGER.warning("SSE: Unknown hub %s", hub_id)
                 return
 
+            # Single receive time shared by every handler of this event
+            self._event_time = datetime.now(timezone.utc)
+
             # Process event by type
-            if event_tag in EVENT_TAG_TO_STATE:
+            if event_tag in _SECURITY_TAGS:
                 await self._handle_security_event(space, event_tag, source_name)
-            elif event_tag in DOOR_EVENTS:
-                self._handle_door_event(
-                    space, event_tag, source_name, source_id, transition
-                )
-            elif event_tag in MOTION_EVENTS:
-                self._handle_motion_event(space, event_tag, source_name, source_id)
-            elif event_tag in SMOKE_EVENTS:
-                self._handle_smoke_event(space, event_tag, source_name, source_id)
-            elif event_tag in FLOOD_EVENTS:
-                self._handle_flood_event(space, event_tag, source_name, source_id)
-            elif event_tag in GLASS_EVENTS:
-                self._handle_glass_event(space, event_tag, source_name, source_id)
-            elif event_tag in TAMPER_EVENTS:
-                self._handle_tamper_event(
-                    space, event_tag, source_name, source_id, transition
-                )
-            elif event_tag in DEVICE_STATUS_EVENTS:
-                self._handle_device_status_event(
-                    space, event_tag, source_name, source_id
-                )
-            elif event_tag in RELAY_EVENTS:
-                self._handle_relay_event(space, event_tag, source_name, source_id)
-            elif event_tag in SCENARIO_EVENTS:
-                self._handle_scenario_event(space, event, event_tag)
-            elif event_tag in VIDEO_EVENTS or event_type_v2 in VIDEO_EVENT_TYPES:
+            elif (handler := self._dispatch.get(event_tag)) is not None:
+                handler(space, event, event_tag, source_name, source_id, transition)
+            elif event_type_v2 in _VIDEO_TYPES_V2:
+                # Video AI event identified by eventTypeV2
                 self._handle_video_event(
-                    space, event_tag, event_type_v2, source_name, source_id
+                    space, event, event_tag, source_name, source_id, transition
                 )
-            elif event_tag in DOORBELL_EVENTS:
-                self._handle_doorbell_event(space, source_name, source_id)
             else:
-                _LOGGER.warning(
-                    "SSE event not handled: tag=%s, type=%s, typeV2=%s, source=%s (id=%s). Raw: %s",
-                    event_tag,
-                    source_type,
-                    event_type_v2 or "none",
-                    source_name,
-                    source_id,
-                    event,
-                )
+                # Only doorbell tags are left once unsupported tags are skipped
+                self._handle_doorbell_event(space, source_name, source_id)
 
-            # Notify HA of update
+            # Notify HA of update for every event, so quick transitions
+            # (e.g. door opened then closed) each reach HA
             self.coordinator.async_set_updated_data(self.coordinator.account)
 
         except Exception as err:
@@ -293,7 +371,7 @@ class SSEManager:
         old_state = space.security_state
         state_changed = old_state != new_state
 
-        _LOGGER.info(
+        _LOGGER.debug(
             "SSE security: tag=%s, old=%s, new=%s, changed=%s",
             event_tag,
             old_state.value,
@@ -306,7 +384,7 @@ class SSEManager:
             source_name = "Home Assistant"
 
         # Group arm/disarm events need a FULL refresh to update group states
-        is_group_event = event_tag in ("grouparm", "groupdisarm")
+        is_group_event = event_tag in _GROUP_SECURITY_TAGS
         if is_group_event:
             _LOGGER.info(
                 "SSE: Group event '%s' detected for hub %s, waiting before refresh",
@@ -324,7 +402,7 @@ class SSEManager:
 
         if state_changed and not is_group_event:
             space.security_state = new_state
-            self._last_state_update[space.hub_id] = time.time()
+            self._last_state_update[space.hub_id] = _time_bucket()
 
         # Always create notification (even if state unchanged)
         _LOGGER.info(
@@ -342,6 +420,17 @@ class SSEManager:
             space_name=space.name,
         )
 
+    def _find_space(self, hub_id: str) -> AjaxSpace | None:
+        """Find space by hub ID."""
+        space = self._hub_index.get(hub_id)
+        spaces = self.coordinator.account.spaces
+        if space is None and len(self._hub_index) != len(spaces):
+            # Spaces added since the index was built: rebuild it. Hubs left out
+            # of the enabled spaces miss without rebuilding.
+            self._hub_index = {s.hub_id: s for s in spaces.values()}
+            space = self._hub_index.get(hub_id)
+        return space
+
     def _find_device(self, space, source_name: str, source_id: str):
         """Find device by name or ID.
 
@@ -354,25 +443,29 @@ class SSEManager:
 
             # For WireInput devices: try matching by suffix (wire input index)
             if len(source_id) == 8:
-                for device in space.devices.values():
-                    if len(device.id) == 16 and device.id.endswith(source_id):
-                        _LOGGER.debug(
-                            "SSE: Matched device %s by suffix %s",
-                            device.name,
-                            source_id,
-                        )
-                        return device
+                device = space.devices_by_id_suffix.get(source_id)
+                if device:
+                    _LOGGER.debug(
+                        "SSE: Matched device %s by suffix %s",
+                        device.name,
+                        source_id,
+                    )
+                    return device
 
         # Fall back to name match
         if source_name:
-            for device in space.devices.values():
-                if device.name == source_name:
-                    return device
+            return space.devices_by_name.get(source_name)
 
         return None
 
     def _handle_door_event(
-        self, space, event_tag: str, source_name: str, source_id: str, transition: str
+        self,
+        space,
+        event: dict[str, Any],
+        event_tag: str,
+        source_name: str,
+        source_id: str,
+        transition: str,
     ) -> None:
         """Handle door opened/closed events."""
         action_key, is_triggered = DOOR_EVENTS[event_tag]
@@ -386,7 +479,7 @@ class SSEManager:
         dev = self._find_device(space, source_name, source_id)
         if dev:
             dev.attributes["door_opened"] = is_triggered
-            dev.attributes["door_opened_at"] = datetime.now(timezone.utc).isoformat()
+            dev.attributes["door_opened_at"] = self._event_time.isoformat()
             _LOGGER.info("SSE instant: %s -> %s", dev.name, action_key)
         else:
             _LOGGER.warning(
@@ -394,19 +487,21 @@ class SSEManager:
             )
 
     def _handle_motion_event(
-        self, space, event_tag: str, source_name: str, source_id: str
+        self,
+        space,
+        event: dict[str, Any],
+        event_tag: str,
+        source_name: str,
+        source_id: str,
+        transition: str,
     ) -> None:
         """Handle motion detected events."""
-        from .models import SecurityState
-
         action_key, is_triggered = MOTION_EVENTS[event_tag]
 
         dev = self._find_device(space, source_name, source_id)
         if dev:
             dev.attributes["motion_detected"] = is_triggered
-            dev.attributes["motion_detected_at"] = datetime.now(
-                timezone.utc
-            ).isoformat()
+            dev.attributes["motion_detected_at"] = self._event_time.isoformat()
             _LOGGER.info("SSE instant: %s -> %s", dev.name, action_key)
 
             # If system is armed and motion detected, trigger alarm
@@ -427,11 +522,15 @@ class SSEManager:
             )
 
     def _handle_smoke_event(
-        self, space, event_tag: str, source_name: str, source_id: str
+        self,
+        space,
+        event: dict[str, Any],
+        event_tag: str,
+        source_name: str,
+        source_id: str,
+        transition: str,
     ) -> None:
         """Handle smoke/fire detector events."""
-        from .models import SecurityState
-
         action_key, is_triggered = SMOKE_EVENTS[event_tag]
 
         dev = self._find_device(space, source_name, source_id)
@@ -454,11 +553,15 @@ class SSEManager:
             )
 
     def _handle_flood_event(
-        self, space, event_tag: str, source_name: str, source_id: str
+        self,
+        space,
+        event: dict[str, Any],
+        event_tag: str,
+        source_name: str,
+        source_id: str,
+        transition: str,
     ) -> None:
         """Handle flood/leak detector events."""
-        from .models import SecurityState
-
         action_key, is_triggered = FLOOD_EVENTS[event_tag]
 
         dev = self._find_device(space, source_name, source_id)
@@ -476,11 +579,15 @@ class SSEManager:
             )
 
     def _handle_glass_event(
-        self, space, event_tag: str, source_name: str, source_id: str
+        self,
+        space,
+        event: dict[str, Any],
+        event_tag: str,
+        source_name: str,
+        source_id: str,
+        transition: str,
     ) -> None:
         """Handle glass break events."""
-        from .models import SecurityState
-
         action_key, is_triggered = GLASS_EVENTS[event_tag]
 
         dev = self._find_device(space, source_name, source_id)
@@ -502,7 +609,13 @@ class SSEManager:
             )
 
     def _handle_tamper_event(
-        self, space, event_tag: str, source_name: str, source_id: str, transition: str
+        self,
+        space,
+        event: dict[str, Any],
+        event_tag: str,
+        source_name: str,
+        source_id: str,
+        transition: str,
     ) -> None:
         """Handle tamper events."""
         action_key, is_triggered = TAMPER_EVENTS[event_tag]
@@ -530,7 +643,13 @@ class SSEManager:
             )
 
     def _handle_device_status_event(
-        self, space, event_tag: str, source_name: str, source_id: str
+        self,
+        space,
+        event: dict[str, Any],
+        event_tag: str,
+        source_name: str,
+        source_id: str,
+        transition: str,
     ) -> None:
         """Handle device status events (online/offline, battery)."""
         action_key, is_problem = DEVICE_STATUS_EVENTS[event_tag]
@@ -552,7 +671,13 @@ class SSEManager:
             )
 
     def _handle_relay_event(
-        self, space, event_tag: str, source_name: str, source_id: str
+        self,
+        space,
+        event: dict[str, Any],
+        event_tag: str,
+        source_name: str,
+        source_id: str,
+        transition: str,
     ) -> None:
         """Handle relay/socket on/off events."""
         action_key, is_on = RELAY_EVENTS[event_tag]
@@ -571,8 +696,8 @@ class SSEManager:
         dev = self._find_device(space, source_name, source_id)
         if dev:
             # Store the last ring time in device attributes
-            dev.attributes["last_ring"] = datetime.now(timezone.utc).isoformat()
-            dev.last_trigger_time = datetime.now(timezone.utc)
+            dev.attributes["last_ring"] = self._event_time.isoformat()
+            dev.last_trigger_time = self._event_time
 
             # Set the doorbell_ring state to True (will auto-reset)
             dev.attributes["doorbell_ring"] = True
@@ -617,7 +742,15 @@ class SSEManager:
         except Exception as err:
             _LOGGER.debug("Error resetting doorbell ring: %s", err)
 
-    def _handle_scenario_event(self, space, event: dict, event_tag: str) -> None:
+    def _handle_scenario_event(
+        self,
+        space,
+        event: dict[str, Any],
+        event_tag: str,
+        source_name: str,
+        source_id: str,
+        transition: str,
+    ) -> None:
         """Handle scenario events that might be triggered by a Button.
 
         When a Button is configured in 'Control' mode, Ajax doesn't send a direct
@@ -628,17 +761,19 @@ class SSEManager:
         additional_data_v2 = event.get("additionalDataV2", [])
         source_name = event.get("sourceObjectName", "")
 
-        initiator_name = None
-        initiator_type = None
-        for data in additional_data_v2:
-            if data.get("additionalDataV2Type") == "INITIATOR_INFO":
-                initiator_name = data.get("objectName")
-                initiator_type = data.get("objectType")
-                break
-
+        initiator = next(
+            (
+                data
+                for data in additional_data_v2
+                if data.get("additionalDataV2Type") == "INITIATOR_INFO"
+            ),
+            None,
+        )
+        initiator_name = initiator.get("objectName") if initiator else None
         if not initiator_name:
             _LOGGER.debug("SSE scenario: no initiator info found")
             return
+        initiator_type = initiator.get("objectType")
 
         _LOGGER.info(
             "SSE scenario: %s triggered by %s (type=%s)",
@@ -662,16 +797,19 @@ class SSEManager:
     def _handle_video_event(
         self,
         space,
+        event: dict[str, Any],
         event_tag: str,
-        event_type_v2: str,
         source_name: str,
         source_id: str,
+        transition: str,
     ) -> None:
         """Handle video AI detection events (motion, human, vehicle, pet).
 
         These events are sent by surveillance cameras (Video Edge devices).
         Updates the channel state to reflect the active detection.
         """
+        event_type_v2 = event.get("eventTypeV2", "")
+
         # Determine the detection type from eventTag or eventTypeV2
         detection_type = None
         if event_tag in VIDEO_EVENTS: